@@ -1,5 +1,8 @@
 # config.py
-from pydantic_settings import BaseSettings
+import sys
+from functools import lru_cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     app_name: str = "TruthPulse"
@@ -35,24 +38,40 @@ class Settings(BaseSettings):
     google_fact_check_api_key: str
     groq_api_key: str  # ← NEW: Required for Groq-powered final verdict
 
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        extra = "ignore"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build Settings once and reuse it — avoids re-parsing .env on reimports."""
+    return Settings()
 
 
 # Create settings instance
-settings = Settings()
+settings = get_settings()
 
 # Export all config values for easy import across the app
 APP_NAME = settings.app_name
 APP_VERSION = settings.app_version
-DEBUG = settings.debug
 ENVIRONMENT = settings.environment
+# Debug tracebacks and the reload file-watcher are development-only — fold the
+# environment check here so production never pays for either
+IS_DEVELOPMENT = settings.environment == "development"
+DEBUG = settings.debug and IS_DEVELOPMENT
 HOST = settings.host
 PORT = settings.port
-RELOAD = settings.reload
-ALLOWED_ORIGINS = settings.allowed_origins.split(",") if settings.allowed_origins else []
+RELOAD = settings.reload and IS_DEVELOPMENT
+# Split once at config load; interned lowercase origins make membership checks
+# a hash probe + pointer compare
+ALLOWED_ORIGINS = frozenset(
+    sys.intern(origin.strip().lower())
+    for origin in (settings.allowed_origins or "").split(",")
+    if origin.strip()
+)
 
 VECTORSTORE_PATH = settings.vectorstore_path
 FAISS_INDEX_PATH = settings.faiss_index_path
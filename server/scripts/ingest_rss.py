@@ -21,8 +21,10 @@ def main():
     log_file = project_root / "logs" / "ingest_rss.log"
     log_file.parent.mkdir(parents=True, exist_ok=True)
     logger.remove()
-    logger.add(log_file, rotation="10 MB", retention="30 days")
-    logger.add(sys.stderr, level="INFO")
+    # enqueue=True pushes writes to a background thread so the ingestion loop
+    # never blocks on disk I/O
+    logger.add(log_file, rotation="10 MB", retention="30 days", enqueue=True)
+    logger.add(sys.stderr, level="INFO", backtrace=False, diagnose=False)
 
     logger.info("=" * 60)
     logger.info("TRUTH PULSE RSS INGESTION STARTED")
@@ -38,8 +40,8 @@ def main():
         logger.warning("No new articles found today")
         return
 
-    # Deduplicate by URL
-    seen_urls = {doc.metadata.get("url", "") for doc in vectorstore_manager.vectorstore.docstore._dict.values()}
+    # Deduplicate by URL — the manager keeps a compact URL set, so no docstore scan
+    seen_urls = vectorstore_manager.known_urls()
     unique_new = []
     for doc in new_docs:
         url = doc.metadata.get("url", "").strip()
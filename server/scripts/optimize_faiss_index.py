@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""
+optimize_faiss_index.py – Convert the saved flat FAISS index to IVF+PQ
+A flat index scans every vector per query (O(N·d)); IVFPQ probes a bounded
+number of clusters instead, which is dramatically faster on large corpora.
+Run once after prepare_vectorstore.py / ingest_rss.py rebuilds the index.
+"""
+
+import sys
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import faiss
+import numpy as np
+from loguru import logger
+
+from src.rag.vectorstore.faiss_manager import faiss_manager
+
+# IVFPQ parameters — 100 clusters with 30 probed per query keeps recall high
+# while touching a fraction of the corpus; 8×8-bit PQ shrinks memory ~16x
+NLIST = 100
+NPROBE = 30
+PQ_SUBQUANTIZERS = 8
+PQ_BITS = 8
+
+# k-means needs a healthy number of training points per cluster
+MIN_VECTORS_TO_CONVERT = NLIST * 40
+
+
+def main():
+    if not faiss_manager or not faiss_manager.vectorstore:
+        logger.error("FAISS index not found — run: python scripts/export_to_faiss.py")
+        sys.exit(1)
+
+    index = faiss_manager.vectorstore.index
+    count = index.ntotal
+    dim = index.d
+
+    if isinstance(index, faiss.IndexIVFPQ):
+        logger.info("Index is already IVFPQ — nothing to do")
+        return
+    if count < MIN_VECTORS_TO_CONVERT:
+        logger.warning(
+            f"Only {count:,} vectors — flat search is fine at this size "
+            f"(need {MIN_VECTORS_TO_CONVERT:,}+ to train {NLIST} clusters)"
+        )
+        return
+
+    logger.info(f"Converting flat index → IVFPQ ({count:,} vectors, dim={dim})")
+
+    vectors = index.reconstruct_n(0, count)
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
+    # Keep the source index's metric: coarse assignment, fine search, and the
+    # score convention downstream thresholds rely on must all agree
+    metric = index.metric_type
+    if metric == faiss.METRIC_INNER_PRODUCT:
+        quantizer = faiss.IndexFlatIP(dim)
+    else:
+        quantizer = faiss.IndexFlatL2(dim)
+    ivfpq = faiss.IndexIVFPQ(quantizer, dim, NLIST, PQ_SUBQUANTIZERS, PQ_BITS, metric)
+
+    logger.info("Training IVFPQ clusters...")
+    ivfpq.train(vectors)
+    ivfpq.add(vectors)
+    ivfpq.nprobe = NPROBE
+
+    # Swap the index inside the LangChain wrapper — docstore mapping is
+    # positional, so the add order above preserves it
+    faiss_manager.vectorstore.index = ivfpq
+    faiss_manager.save_local(folder_path=str(faiss_manager.index_path.parent))
+
+    logger.success(f"IVFPQ index saved — nlist={NLIST}, nprobe={NPROBE}")
+    logger.success("Searches now probe a bounded cluster set instead of the full corpus")
+
+
+if __name__ == "__main__":
+    main()
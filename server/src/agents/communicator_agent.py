@@ -1,14 +1,70 @@
 """Communicator Agent - Tailors verification results into audience-appropriate explanations."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, List, Optional, Literal
-import pyttsx3
 from src.agents.verifier_agent import VerificationResult
 from loguru import logger
 
 AudienceType = Literal["kids", "elderly", "general", "expert"]
 
-@dataclass
+# Constant explanation tables hoisted to module level so communicate() does a
+# single dict lookup per call instead of rebuilding these literals every time
+_EXPLANATIONS: Dict[str, Dict[str, str]] = {
+    "kids": {
+        "true": "This information is true. People checked carefully and found proof that shows this really happened.",
+        "false": "This information is not true. When people looked carefully, they found out that this is wrong.",
+        "unverified": "We don't know yet if this information is true. There isn't enough information to be sure.",
+        "mixed": "Some information says this is true, but other information says it is not true."
+    },
+    "elderly": {
+        "true": "After careful examination, reliable sources have confirmed that this information is accurate.",
+        "false": "After thorough investigation, reliable sources have determined that this information is incorrect.",
+        "unverified": "There is currently not enough reliable information available to determine whether this information is true or false.",
+        "mixed": "There is conflicting information available, with some sources supporting the claim and others contradicting it."
+    },
+    "general": {
+        "true": "The available evidence supports the claim and confirms its accuracy.",
+        "false": "The available evidence contradicts the claim and shows it to be incorrect.",
+        "unverified": "There is insufficient reliable evidence available to determine whether the claim is true or false.",
+        "mixed": "There is substantial evidence both supporting and contradicting the claim."
+    },
+    "expert": {
+        "true": "The verification process has determined that the claim is supported by the available evidence.",
+        "false": "The verification process has determined that the claim is contradicted by the available evidence.",
+        "unverified": "There is insufficient corroborating evidence to establish the veracity of the claim.",
+        "mixed": "The evidence base contains substantial contradictory information regarding the claim."
+    }
+}
+
+# Audience-specific confidence descriptors as flat (low, medium, high) tuples
+_CONFIDENCE_DESCRIPTORS: Dict[str, tuple] = {
+    "kids": ("not completely sure", "pretty sure", "very sure"),
+    "elderly": ("less certain", "reasonably confident", "very confident"),
+    "general": ("low confidence", "moderate confidence", "high confidence"),
+    "expert": ("low confidence", "moderate confidence", "high confidence"),
+}
+
+# Index with a bool: _PLURAL[n > 1] → "" or "s"
+_PLURAL = ("", "s")
+
+_SIMPLE_SUMMARIES: Dict[str, str] = {
+    "true": "The claim has been verified as true.",
+    "false": "The claim has been determined to be false.",
+    "unverified": "There is not enough reliable evidence to verify the claim.",
+    "mixed": "There is conflicting evidence both supporting and contradicting the claim."
+}
+
+_VERDICT_EXPLANATIONS: Dict[str, str] = {
+    "true": "This means the available evidence confirms that the information is accurate.",
+    "false": "This means the available evidence shows that the information is incorrect.",
+    "unverified": "This means there is not enough reliable evidence to determine whether the information is true or false.",
+    "mixed": "This means there is reliable evidence both supporting and contradicting the information."
+}
+
+@dataclass(slots=True, frozen=True)
 class TailoredExplanation:
     """Structured explanation tailored for a specific audience."""
     audience: AudienceType
@@ -22,53 +78,40 @@ class CommunicatorAgent:
     """Agent that adapts verification results for different audiences with optional voice output."""
     
     def __init__(self):
-        self.audience_strategies = {
-            "kids": {
-                "tone": "simple and friendly",
-                "complexity": "very low",
-                "confidence_descriptors": {"high": "very sure", "medium": "pretty sure", "low": "not completely sure"}
-            },
-            "elderly": {
-                "tone": "clear and respectful",
-                "complexity": "low",
-                "confidence_descriptors": {"high": "very confident", "medium": "reasonably confident", "low": "less certain"}
-            },
-            "general": {
-                "tone": "neutral and factual",
-                "complexity": "moderate",
-                "confidence_descriptors": {"high": "high confidence", "medium": "moderate confidence", "low": "low confidence"}
-            },
-            "expert": {
-                "tone": "precise and technical",
-                "complexity": "high",
-                "confidence_descriptors": {"high": "high confidence", "medium": "moderate confidence", "low": "low confidence"}
-            }
-        }
-        
-        # Initialize TTS engine for optional voice output
-        try:
-            self.tts_engine = pyttsx3.init()
-            self.tts_available = True
-            # Set default voice properties
-            self.tts_engine.setProperty('rate', 180)
-            self.tts_engine.setProperty('volume', 0.9)
-        except Exception:
-            self.tts_engine = None
-            self.tts_available = False
-            logger.warning("Text-to-speech engine not available")
+        # TTS engine is created lazily on first use — importing pyttsx3 and
+        # loading its drivers is too expensive to pay on server startup
+        self._tts_engine = None
+        self.tts_available = True
+        # pyttsx3 is not thread-safe on all drivers — a single worker serializes
+        # all speech without blocking the event loop
+        self._tts_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+
+    @property
+    def tts_engine(self):
+        """Lazily import pyttsx3 and initialize the engine on first access."""
+        if self._tts_engine is None and self.tts_available:
+            try:
+                import pyttsx3
+                self._tts_engine = pyttsx3.init()
+                # Set default voice properties
+                self._tts_engine.setProperty('rate', 180)
+                self._tts_engine.setProperty('volume', 0.9)
+            except Exception:
+                self._tts_engine = None
+                self.tts_available = False
+                logger.warning("Text-to-speech engine not available")
+        return self._tts_engine
 
     def communicate(self, verification_result: VerificationResult, audience: AudienceType = "general") -> TailoredExplanation:
         """Generate an audience-appropriate explanation of the verification result."""
-        if audience not in self.audience_strategies:
+        if audience not in _CONFIDENCE_DESCRIPTORS:
             raise ValueError(f"Unsupported audience: {audience}")
-        
-        strategy = self.audience_strategies[audience]
-        
-        explanation = self._generate_explanation(verification_result, strategy)
+
+        explanation = self._generate_explanation(verification_result, audience)
         key_points = self._generate_key_points(verification_result)
-        simple_summary = self._generate_simple_summary(verification_result, strategy)
-        confidence_level = self._format_confidence(verification_result.confidence, strategy)
-        verdict_explanation = self._generate_verdict_explanation(verification_result, strategy)
+        simple_summary = self._generate_simple_summary(verification_result)
+        confidence_level = self._format_confidence(verification_result.confidence, audience)
+        verdict_explanation = self._generate_verdict_explanation(verification_result)
         
         return TailoredExplanation(
             audience=audience,
@@ -79,21 +122,29 @@ class CommunicatorAgent:
             verdict_explanation=verdict_explanation
         )
 
-    def speak_explanation(self, explanation: TailoredExplanation, generate_audio_file: bool = False) -> Optional[str]:
-        """Convert the tailored explanation to spoken audio."""
-        if not self.tts_available:
+    async def speak_explanation(self, explanation: TailoredExplanation, generate_audio_file: bool = False) -> Optional[str]:
+        """Convert the tailored explanation to spoken audio off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._tts_executor, self._speak_sync, explanation, generate_audio_file
+        )
+
+    def _speak_sync(self, explanation: TailoredExplanation, generate_audio_file: bool) -> Optional[str]:
+        """Blocking TTS rendering — always runs on the serialized TTS worker."""
+        if self.tts_engine is None:
             raise RuntimeError("Text-to-speech engine is not available")
-        
+
         # Use simple summary for voice output as it's the most concise
         text_to_speak = explanation.simple_summary
-        
+
         if generate_audio_file:
             import tempfile
             with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as temp_file:
                 audio_file_path = temp_file.name
-                self.tts_engine.save_to_file(text_to_speak, audio_file_path)
-                self.tts_engine.runAndWait()
-                return audio_file_path
+            # Handle is closed before SAPI opens the path (Windows requirement)
+            self.tts_engine.save_to_file(text_to_speak, audio_file_path)
+            self.tts_engine.runAndWait()
+            return audio_file_path
         else:
             # Direct playback
             self._configure_voice_for_audience(explanation.audience)
@@ -103,49 +154,21 @@ class CommunicatorAgent:
 
     def _configure_voice_for_audience(self, audience: AudienceType):
         """Configure voice properties based on the target audience."""
-        if not self.tts_available:
+        # Only touch the engine if it has already been materialized
+        if self._tts_engine is None:
             return
-        
+
         if audience == "kids":
-            self.tts_engine.setProperty('rate', 200)  # Slightly faster and more engaging
+            self._tts_engine.setProperty('rate', 200)  # Slightly faster and more engaging
         elif audience == "elderly":
-            self.tts_engine.setProperty('rate', 140)  # Slower for better comprehension
+            self._tts_engine.setProperty('rate', 140)  # Slower for better comprehension
         else:
-            self.tts_engine.setProperty('rate', 180)  # Standard rate
+            self._tts_engine.setProperty('rate', 180)  # Standard rate
 
-    def _generate_explanation(self, result: VerificationResult, strategy: Dict) -> str:
+    def _generate_explanation(self, result: VerificationResult, audience: AudienceType) -> str:
         """Generate the main explanation tailored to the specified audience."""
         verdict = result.verdict
-        
-        if strategy["complexity"] == "very low":  # Kids
-            explanations = {
-                "true": "This information is true. People checked carefully and found proof that shows this really happened.",
-                "false": "This information is not true. When people looked carefully, they found out that this is wrong.",
-                "unverified": "We don't know yet if this information is true. There isn't enough information to be sure.",
-                "mixed": "Some information says this is true, but other information says it is not true."
-            }
-        elif strategy["tone"] == "clear and respectful":  # Elderly
-            explanations = {
-                "true": "After careful examination, reliable sources have confirmed that this information is accurate.",
-                "false": "After thorough investigation, reliable sources have determined that this information is incorrect.",
-                "unverified": "There is currently not enough reliable information available to determine whether this information is true or false.",
-                "mixed": "There is conflicting information available, with some sources supporting the claim and others contradicting it."
-            }
-        elif strategy["tone"] == "neutral and factual":  # General
-            explanations = {
-                "true": "The available evidence supports the claim and confirms its accuracy.",
-                "false": "The available evidence contradicts the claim and shows it to be incorrect.",
-                "unverified": "There is insufficient reliable evidence available to determine whether the claim is true or false.",
-                "mixed": "There is substantial evidence both supporting and contradicting the claim."
-            }
-        else:  # Expert
-            explanations = {
-                "true": "The verification process has determined that the claim is supported by the available evidence.",
-                "false": "The verification process has determined that the claim is contradicted by the available evidence.",
-                "unverified": "There is insufficient corroborating evidence to establish the veracity of the claim.",
-                "mixed": "The evidence base contains substantial contradictory information regarding the claim."
-            }
-        
+        explanations = _EXPLANATIONS[audience]
         base_explanation = explanations.get(verdict, f"The claim has been evaluated and determined to be {verdict}.")
         return f"{base_explanation} {result.rationale}"
 
@@ -153,53 +176,48 @@ class CommunicatorAgent:
         """Generate key points summarizing the verification result."""
         key_points = [f"The claim has been determined to be {result.verdict}."]
         
-        supporting_count = len([e for e in result.evidence if e.stance == "support"])
-        contradicting_count = len([e for e in result.evidence if e.stance == "refute"])
+        # Single pass over the evidence — no throwaway lists
+        supporting_count = contradicting_count = 0
+        for e in result.evidence:
+            if e.stance == "support":
+                supporting_count += 1
+            elif e.stance == "refute":
+                contradicting_count += 1
         
         if supporting_count > 0:
-            evidence_summary = f"{supporting_count} source{'s' if supporting_count > 1 else ''} support this claim"
+            evidence_summary = f"{supporting_count} source{_PLURAL[supporting_count > 1]} support this claim"
             if contradicting_count > 0:
-                evidence_summary += f" and {contradicting_count} source{'s' if contradicting_count > 1 else ''} contradict it"
+                evidence_summary += f" and {contradicting_count} source{_PLURAL[contradicting_count > 1]} contradict it"
             key_points.append(evidence_summary)
         elif contradicting_count > 0:
-            key_points.append(f"{contradicting_count} source{'s' if contradicting_count > 1 else ''} contradict this claim")
+            key_points.append(f"{contradicting_count} source{_PLURAL[contradicting_count > 1]} contradict this claim")
         else:
             key_points.append("No conclusive supporting or contradicting evidence was found")
         
         return key_points
 
-    def _generate_simple_summary(self, result: VerificationResult, strategy: Dict) -> str:
+    def _generate_simple_summary(self, result: VerificationResult) -> str:
         """Generate a concise, one-sentence summary."""
-        summaries = {
-            "true": "The claim has been verified as true.",
-            "false": "The claim has been determined to be false.",
-            "unverified": "There is not enough reliable evidence to verify the claim.",
-            "mixed": "There is conflicting evidence both supporting and contradicting the claim."
-        }
-        return summaries.get(result.verdict, "The claim could not be conclusively verified.")
-
-    def _format_confidence(self, confidence: float, strategy: Dict) -> str:
+        return _SIMPLE_SUMMARIES.get(result.verdict, "The claim could not be conclusively verified.")
+
+    def _format_confidence(self, confidence: float, audience: AudienceType) -> str:
         """Format the confidence level appropriately for the audience."""
-        descriptors = strategy["confidence_descriptors"]
+        low, medium, high = _CONFIDENCE_DESCRIPTORS[audience]
         if confidence >= 0.8:
-            return descriptors["high"]
+            return high
         elif confidence >= 0.6:
-            return descriptors["medium"]
+            return medium
         else:
-            return descriptors["low"]
+            return low
 
-    def _generate_verdict_explanation(self, result: VerificationResult, strategy: Dict) -> str:
+    def _generate_verdict_explanation(self, result: VerificationResult) -> str:
         """Generate a specific explanation of what the verdict means."""
-        explanations = {
-            "true": "This means the available evidence confirms that the information is accurate.",
-            "false": "This means the available evidence shows that the information is incorrect.",
-            "unverified": "This means there is not enough reliable evidence to determine whether the information is true or false.",
-            "mixed": "This means there is reliable evidence both supporting and contradicting the information."
-        }
-        return explanations.get(result.verdict, "The determination about the accuracy of the information could not be conclusively established.")
+        return _VERDICT_EXPLANATIONS.get(result.verdict, "The determination about the accuracy of the information could not be conclusively established.")
 
-# Create singleton instance
-communicator_agent = CommunicatorAgent()
+# Lazily-created singleton — agent is only built when first requested
+@lru_cache(maxsize=1)
+def get_communicator_agent() -> CommunicatorAgent:
+    return CommunicatorAgent()
 
 if __name__ == "__main__":
     # Example usage
@@ -215,8 +233,9 @@ if __name__ == "__main__":
     )
     
     # Generate explanations for different audiences
+    agent = get_communicator_agent()
     for audience in ["kids", "elderly", "general"]:
-        explanation = communicator_agent.communicate(mock_result, audience)
+        explanation = agent.communicate(mock_result, audience)
         print(f"\n--- Explanation for {audience} audience ---")
         print(f"Simple Summary: {explanation.simple_summary}")
         print(f"Main Explanation: {explanation.explanation}")
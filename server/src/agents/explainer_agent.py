@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass, asdict
 from typing import Dict, List, Optional
 import pyttsx3
+import queue
 import threading
 from loguru import logger
 from src.agents.detector_agent import DetectionResult
@@ -29,41 +30,49 @@ class VoiceManager:
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
+                # Initialize fully inside the lock so a second thread can
+                # never observe a half-constructed singleton
                 if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialized = False
+                    instance = super().__new__(cls)
+                    instance._init_engine()
+                    cls._instance = instance
         return cls._instance
 
-    def __init__(self):
-        if self._initialized:
-            return
+    def _init_engine(self) -> None:
         try:
             self.tts_engine = pyttsx3.init()
-            self.is_speaking = False
-            self._initialized = True
         except Exception:
             self.tts_engine = None
-            self.is_speaking = False
+        # Speech runs on a dedicated daemon worker — request threads only
+        # enqueue text, so runAndWait() never blocks verification latency
+        self._queue: queue.Queue = queue.Queue(maxsize=8)
+        if self.tts_engine is not None:
+            threading.Thread(target=self._speak_loop, daemon=True, name="voice").start()
+
+    def _speak_loop(self) -> None:
+        while True:
+            text = self._queue.get()
+            try:
+                self.tts_engine.say(text)
+                self.tts_engine.runAndWait()
+            except Exception:
+                logger.warning("Voice output failed")
+            finally:
+                self._queue.task_done()
 
     def speak(self, text: str, agent_name: str) -> bool:
-        """Attempt to speak the given text. Returns True if speaking was started."""
+        """Queue the text for speech. Returns True if it was accepted."""
         if self.tts_engine is None:
             return False
-
-        if self.is_speaking:
-            return False
-
-        self.is_speaking = True
         try:
-            self.tts_engine.say(text)
-            self.tts_engine.runAndWait()
+            self._queue.put_nowait(text)
             return True
-        finally:
-            self.is_speaking = False
+        except queue.Full:
+            return False
 
     def can_speak(self) -> bool:
         """Check if speech can be initiated."""
-        return not self.is_speaking
+        return self.tts_engine is not None and not self._queue.full()
 
 class ExplainerAgent:
     """Converts technical verification results into plain-language explanations."""
@@ -74,8 +83,10 @@ class ExplainerAgent:
     def explain(self, verification: VerificationResult, detection: Optional[DetectionResult] = None) -> ExplanationResult:
         """Generate human-friendly explanation from verification results using exact specified phrasing."""
         explanation = self._build_explanation(verification, detection)
-        key_points = self._extract_key_points(verification)
-        sources_summary = self._summarize_sources(verification)
+        # Stats are collected in one pass and shared by both summaries
+        rss_sources, dataset_count, rss_count, fact_check_count = self._collect_evidence_stats(verification.evidence)
+        key_points = self._extract_key_points(rss_sources, dataset_count, rss_count, fact_check_count)
+        sources_summary = self._summarize_sources(rss_sources)
         confidence_note = self._build_confidence_note(verification.confidence)
 
         result = ExplanationResult(
@@ -102,19 +113,28 @@ class ExplainerAgent:
         else:  # unverified
             return "No reliable information found; be cautious."
 
-    def _extract_key_points(self, verification: VerificationResult) -> List[str]:
-        """Extract key points from evidence."""
+    @staticmethod
+    def _collect_evidence_stats(evidence: List[EvidenceItem]):
+        """Gather source names and origin counts in a single pass over the evidence."""
+        rss_sources: List[str] = []
+        dataset_count = rss_count = fact_check_count = 0
+        for e in evidence:
+            if e.origin == "dataset":
+                dataset_count += 1
+            elif e.origin == "rss":
+                rss_count += 1
+                if getattr(e, "reliable", False):
+                    rss_sources.append(getattr(e, "source", None) or e.title)
+            elif e.origin == "fact_check":
+                fact_check_count += 1
+        return rss_sources, dataset_count, rss_count, fact_check_count
+
+    def _extract_key_points(self, rss_sources: List[str], dataset_count: int, rss_count: int, fact_check_count: int) -> List[str]:
+        """Extract key points from the shared evidence stats."""
         points = []
-        rss_sources = [e.source or e.title for e in verification.evidence if e.origin == "rss" and e.reliable]
-        
         if rss_sources:
             points.append(f"Verified sources: {', '.join(rss_sources)}")
-        
-        # Add evidence counts
-        dataset_count = sum(1 for e in verification.evidence if e.origin == "dataset")
-        rss_count = sum(1 for e in verification.evidence if e.origin == "rss")
-        fact_check_count = sum(1 for e in verification.evidence if e.origin == "fact_check")
-        
+
         if dataset_count > 0:
             points.append(f"Checked {dataset_count} historical records")
         if rss_count > 0:
@@ -124,10 +144,8 @@ class ExplainerAgent:
         
         return points[:4]
 
-    def _summarize_sources(self, verification: VerificationResult) -> str:
+    def _summarize_sources(self, rss_sources: List[str]) -> str:
         """Summarize the verified sources, focusing on RSS sources."""
-        rss_sources = [e.source or e.title for e in verification.evidence if e.origin == "rss" and e.reliable]
-        
         if not rss_sources:
             return "No verified sources available"
         
@@ -2,12 +2,16 @@
 """NATIONAL-LEVEL Professional Fact-Checker — Works for ALL India (2025 Ready)"""
 
 from __future__ import annotations
-from dataclasses import asdict, dataclass, field
-from typing import List, Literal, Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field, replace
+from typing import List, Literal, Optional, Tuple
 import re
+import time
+import numpy as np
 from loguru import logger
 
 from config import GROQ_API_KEY
+from src.agents.detector_agent import DetectionResult
 from src.rag.vectorstore.faiss_manager import faiss_manager
 from src.utils.rss_parser import rss_parser
 from groq import Groq
@@ -16,6 +20,45 @@ groq_client = Groq(api_key=GROQ_API_KEY) if GROQ_API_KEY else None
 
 VerdictLabel = Literal["true", "false", "unverified", "mixed"]
 
+# Semantic query cache — near-duplicate claims share a full verification run,
+# skipping the FAISS searches, the RSS fetch and the Groq round-trip entirely
+# Hot-path constants: Groq output patterns compiled once, state keywords
+# hoisted so verify_claim doesn't rebuild the list per call
+_VERDICT_RE = re.compile(r"VERDICT:\s*(TRUE|FALSE|MIXED)", re.I)
+_CONF_RE = re.compile(r"CONFIDENCE:\s*([0-9]*\.?[0-9]+)")
+_REASON_RE = re.compile(r"REASON:\s*(.+)", re.DOTALL)
+
+_STATE_KEYWORDS = frozenset({
+    "delhi", "up", "uttar pradesh", "maharashtra", "bihar",
+    "tamil nadu", "kerala", "gujarat", "rajasthan"
+})
+
+# Keyword trigger → extra search queries it unlocks
+_TRIGGER_QUERIES = {
+    "cbse": ("CBSE official circular", "CBSE datesheet 2026", "cbseacademic.nic.in"),
+    "up board": ("UP Board official announcement 2025-26",),
+    "upmsp": ("UP Board official announcement 2025-26",),
+    "neet": ("NTA official notification",),
+    "jee": ("NTA official notification",),
+}
+
+# One fused alternation finds every trigger in a single scan of the claim
+# instead of ~15 separate substring searches (longest-first so multi-word
+# phrases win over their prefixes)
+_TRIGGER_RE = re.compile(
+    r"(?<![a-z])(?:"
+    + "|".join(
+        re.escape(t)
+        for t in sorted({*_STATE_KEYWORDS, *_TRIGGER_QUERIES}, key=len, reverse=True)
+    )
+    + r")(?![a-z])"
+)
+
+CACHE_SIMILARITY_THRESHOLD = 0.90
+CACHE_TTL_SECONDS = 3600
+CACHE_MAX_ENTRIES = 1024
+_qv_cache: List[Tuple[np.ndarray, "VerificationResult", float]] = []
+
 
 @dataclass
 class EvidenceItem:
@@ -41,8 +84,93 @@ class VerificationResult:
 
 
 class VerifierAgent:
-    def verify_claim(self, claim: str) -> VerificationResult:
+    @staticmethod
+    def _embed_claim(claim: str) -> Optional[np.ndarray]:
+        """Embed the claim once as a unit vector (shared with the cache)."""
+        if not faiss_manager:
+            return None
+        vec = np.asarray(faiss_manager.embeddings.embed_query(claim), dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    @staticmethod
+    def _cache_lookup(claim_vec: Optional[np.ndarray]) -> Optional[VerificationResult]:
+        """Return a cached result for a semantically near-identical claim."""
+        if claim_vec is None or not _qv_cache:
+            return None
+        now = time.time()
+        best_sim, best_result = CACHE_SIMILARITY_THRESHOLD, None
+        for vec, result, stamp in _qv_cache:
+            if now - stamp > CACHE_TTL_SECONDS:
+                continue
+            sim = float(np.dot(vec, claim_vec))
+            if sim >= best_sim:
+                best_sim, best_result = sim, result
+        return best_result
+
+    @staticmethod
+    def _cache_store(claim_vec: Optional[np.ndarray], result: VerificationResult) -> None:
+        if claim_vec is None:
+            return
+        if len(_qv_cache) >= CACHE_MAX_ENTRIES:
+            del _qv_cache[0]  # oldest entry first
+        _qv_cache.append((claim_vec, result, time.time()))
+
+    @staticmethod
+    def _extend_dataset_evidence(hits, evidence: List[EvidenceItem], seen: set) -> None:
+        """Append FAISS hits as dataset evidence, deduping by URL/title."""
+        for doc, score in hits:
+            url = doc.metadata.get("url", "")
+            title = doc.metadata.get("title", "")
+            key = url or title
+            if key in seen:
+                continue
+            seen.add(key)
+            evidence.append(EvidenceItem(
+                title=title,
+                url=url,
+                summary=doc.page_content[:1100].strip(),
+                stance="neutral",
+                published=doc.metadata.get("published") or doc.metadata.get("date"),
+                source_domain=url.split("/")[2] if url else None,
+                origin="dataset"
+            ))
+
+    @staticmethod
+    def _score_evidence(evidence: List[EvidenceItem], claim_lower: str) -> Tuple[int, bool]:
+        """Aggregate verbatim-support and refute signals in one pass."""
+        strong_supports = 0
+        has_refute = False
+        for i, e in enumerate(evidence):
+            if i < 5 and claim_lower in e.summary.lower():
+                strong_supports += 1
+            if e.stance == "refute":
+                has_refute = True
+        return strong_supports, has_refute
+
+    def verify_claim(self, claim: str, detection: Optional["DetectionResult"] = None) -> VerificationResult:
         logger.info(f"Verifying (India-wide): {claim}")
+
+        # A question has no factual assertion to check — skip retrieval and
+        # the LLM entirely (cheapest gate, so it runs before embedding)
+        if detection is not None and detection.claim_type == "question":
+            logger.info("Claim is a question — returning unverified without retrieval")
+            return VerificationResult(
+                claim=claim,
+                verdict="unverified",
+                confidence=0.2,
+                rationale="The input is a question rather than a verifiable factual claim.",
+                evidence=[]
+            )
+
+        # Near-duplicate claims (reshares, minor rewording) hit the semantic
+        # cache and skip the whole retrieval + LLM pipeline
+        claim_vec = self._embed_claim(claim)
+        cached = self._cache_lookup(claim_vec)
+        if cached is not None:
+            logger.info(f"Semantic cache hit → {cached.verdict.upper()} for: {claim[:60]}...")
+            return replace(cached, claim=claim)
+
         evidence = []
         seen = set()
 
@@ -55,71 +183,104 @@ class VerifierAgent:
             claim + " latest update"
         ]
 
-        # Add context-specific queries based on keywords
+        # Add context-specific queries based on keywords — all triggers are
+        # found in one pass over the claim
         claim_lower = claim.lower()
         extra_queries = []
 
-        if any(state in claim_lower for state in ["delhi", "up", "uttar pradesh", "maharashtra", "bihar", "tamil nadu", "kerala", "gujarat", "rajasthan"]):
+        trigger_hits = set(_TRIGGER_RE.findall(claim_lower))
+        if trigger_hits & _STATE_KEYWORDS:
             extra_queries.extend([
                 f"{claim} school holiday calendar 2025-26",
                 f"{claim} education department circular"
             ])
+        for trigger, queries in _TRIGGER_QUERIES.items():
+            if trigger in trigger_hits:
+                extra_queries.extend(queries)
+
+        # Exact dedup; near-duplicate embeddings are collapsed in the batch search
+        all_queries = list(dict.fromkeys(base_queries + extra_queries))
+
+        # FAISS search and the RSS fetch are independent — overlap them so
+        # the retrieval stage costs max(FAISS, RSS) instead of the sum.
+        # Only 20 evidence items survive to the prompt, so k=10 across ~12
+        # queries is plenty; a deeper single-query pass backfills if the
+        # cheap pass comes up short.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            faiss_future = pool.submit(
+                faiss_manager.search_evidence_batch, all_queries, 10, 0.90
+            )
+            rss_future = pool.submit(rss_parser.fetch_recent, 120, 30)
+
+            try:
+                batched_hits = faiss_future.result()
+            except Exception as e:
+                logger.debug(f"FAISS search error: {e}")
+                batched_hits = []
 
-        if "cbse" in claim_lower:
-            extra_queries.extend(["CBSE official circular", "CBSE datesheet 2026", "cbseacademic.nic.in"])
-        if "up board" in claim_lower or "upmsp" in claim_lower:
-            extra_queries.append("UP Board official announcement 2025-26")
-        if "neet" in claim_lower or "jee" in claim_lower:
-            extra_queries.append("NTA official notification")
+            try:
+                rss_docs = rss_future.result()
+            except Exception as e:
+                logger.warning(f"RSS failed: {e}")
+                rss_docs = []
 
-        all_queries = base_queries + extra_queries
+        self._extend_dataset_evidence(batched_hits, evidence, seen)
 
-        # Search FAISS deeply
-        for query in all_queries:
+        if len(evidence) < 20:
             try:
-                results = faiss_manager.vectorstore.similarity_search_with_score(query, k=50)
-                for doc, score in results:
-                    url = doc.metadata.get("url", "")
-                    title = doc.metadata.get("title", "")
-                    key = url or title
-                    if key in seen or score > 0.90:
-                        continue
-                    seen.add(key)
-                    evidence.append(EvidenceItem(
-                        title=title,
-                        url=url,
-                        summary=doc.page_content[:1800],
-                        stance="neutral",
-                        published=doc.metadata.get("published") or doc.metadata.get("date"),
-                        source_domain=url.split("/")[2] if url else None,
-                        origin="dataset"
-                    ))
+                backfill_hits = faiss_manager.search_evidence_batch([claim], k=50, max_score=0.90)
             except Exception as e:
-                logger.debug(f"FAISS search error: {e}")
+                logger.debug(f"FAISS backfill error: {e}")
+                backfill_hits = []
+            self._extend_dataset_evidence(backfill_hits, evidence, seen)
 
         # Add fresh RSS news (critical for breaking updates)
-        try:
-            for doc in rss_parser.fetch_recent(days=120, max_per_feed=30):
-                url = doc.metadata.get("url", "")
-                if url in seen:
-                    continue
-                seen.add(url)
-                evidence.append(EvidenceItem(
-                    title=doc.metadata.get("title", "News"),
-                    url=url,
-                    summary=doc.page_content[:1800],
-                    stance="neutral",
-                    published=doc.metadata.get("published"),
-                    origin="rss"
-                ))
-        except Exception as e:
-            logger.warning(f"RSS failed: {e}")
+        for doc in rss_docs:
+            url = doc.metadata.get("url", "")
+            if url in seen:
+                continue
+            seen.add(url)
+            evidence.append(EvidenceItem(
+                title=doc.metadata.get("title", "News"),
+                url=url,
+                summary=doc.page_content[:1100].strip(),
+                stance="neutral",
+                published=doc.metadata.get("published"),
+                origin="rss"
+            ))
+
+        # Short-circuit the Groq round-trip (the slowest step) when the
+        # evidence alone decides the outcome
+        if not evidence:
+            logger.info("No evidence gathered — returning unverified without LLM call")
+            result = VerificationResult(
+                claim=claim,
+                verdict="unverified",
+                confidence=0.3,
+                rationale="No credible sources found to evaluate this claim.",
+                evidence=[]
+            )
+            self._cache_store(claim_vec, result)
+            return result
+
+        strong_supports, has_refute = self._score_evidence(evidence, claim_lower)
+        if strong_supports >= 3 and not has_refute:
+            logger.info(f"{strong_supports} top sources state the claim verbatim — skipping LLM call")
+            result = VerificationResult(
+                claim=claim,
+                verdict="true",
+                confidence=0.85,
+                rationale="Multiple credible sources directly report this claim.",
+                evidence=evidence[:20]
+            )
+            self._cache_store(claim_vec, result)
+            return result
 
         # Build professional evidence summary
         evidence_text = "\n\n".join([
             f"[{i+1}] {e.source_domain or 'News'} | {e.published or 'Recent'}\n"
             f"{e.title}\n"
-            f"{e.summary[:1100].strip()}"
+            f"{e.summary}"
             for i, e in enumerate(evidence[:20])
         ]) if evidence else "No credible sources found."
 
@@ -160,9 +321,9 @@ REASON: One clear, professional sentence.
                 )
                 output = resp.choices[0].message.content.strip()
 
-                v = re.search(r"VERDICT:\s*(TRUE|FALSE|MIXED)", output, re.I)
-                c = re.search(r"CONFIDENCE:\s*([0-9]*\.?[0-9]+)", output)
-                r = re.search(r"REASON:\s*(.+)", output, re.DOTALL)
+                v = _VERDICT_RE.search(output)
+                c = _CONF_RE.search(output)
+                r = _REASON_RE.search(output)
 
                 verdict = v.group(1).lower() if v else "unverified"
                 confidence = float(c.group(1)) if c else 0.5
@@ -174,13 +335,15 @@ REASON: One clear, professional sentence.
 
         logger.success(f"VERDICT: {verdict.upper()} ({confidence:.3f}) → {claim[:60]}...")
 
-        return VerificationResult(
+        result = VerificationResult(
             claim=claim,
             verdict=verdict,
             confidence=round(confidence, 3),
             rationale=reason,
             evidence=evidence[:20]
         )
+        self._cache_store(claim_vec, result)
+        return result
 
 
 # Global instance
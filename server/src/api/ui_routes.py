@@ -1,5 +1,7 @@
 # src/api/routes.py
-import json
+import orjson
+import threading
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from fastapi import APIRouter, Depends, HTTPException, status
@@ -11,30 +13,64 @@ from src.agents.verifier_agent import verifier_agent
 
 router = APIRouter()
 
-# === PERSISTENCE: Save claims to JSON file ===
-CLAIMS_DB_PATH = Path("data") / "verified_claims.json"
+# === PERSISTENCE: Append-only JSON-Lines file ===
+# One line per claim means each /verify writes O(1) bytes instead of
+# re-serializing the whole history on every request
+CLAIMS_DB_PATH = Path("data") / "verified_claims.jsonl"
+LEGACY_CLAIMS_DB_PATH = Path("data") / "verified_claims.json"
 CLAIMS_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+_claims_write_lock = threading.Lock()
+
 # Load existing claims on startup
 def load_claims() -> List[dict]:
     if CLAIMS_DB_PATH.exists():
+        claims = []
         try:
-            with open(CLAIMS_DB_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data if isinstance(data, list) else []
+            with open(CLAIMS_DB_PATH, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        claims.append(orjson.loads(line))
+            return claims
         except Exception as e:
             logger.warning(f"Failed to load claims DB: {e}. Starting fresh.")
+            return []
+    # One-time migration from the old whole-file JSON format
+    if LEGACY_CLAIMS_DB_PATH.exists():
+        try:
+            with open(LEGACY_CLAIMS_DB_PATH, "rb") as f:
+                data = orjson.loads(f.read())
+            if isinstance(data, list):
+                with open(CLAIMS_DB_PATH, "wb") as f:
+                    for record in data:
+                        f.write(orjson.dumps(record) + b"\n")
+                logger.info(f"Migrated {len(data)} claims to JSONL format")
+                return data
+        except Exception as e:
+            logger.warning(f"Failed to migrate legacy claims DB: {e}. Starting fresh.")
     return []
 
-def save_claims(claims: List[dict]):
+def append_claim(record: dict):
     try:
-        with open(CLAIMS_DB_PATH, "w", encoding="utf-8") as f:
-            json.dump(claims, f, indent=2, ensure_ascii=False)
+        with _claims_write_lock:
+            with open(CLAIMS_DB_PATH, "ab") as f:
+                f.write(orjson.dumps(record) + b"\n")
     except Exception as e:
-        logger.error(f"Failed to save claims to disk: {e}")
+        logger.error(f"Failed to save claim to disk: {e}")
 
-# Global in-memory store (persisted to disk)
+# Global in-memory store (persisted to disk) plus O(1) lookup indices —
+# id and verdict lookups otherwise scan the whole history per request
 VERIFIED_CLAIMS = load_claims()
+CLAIMS_BY_ID: dict = {}
+CLAIMS_BY_VERDICT: defaultdict = defaultdict(list)
+
+def _index_claim(record: dict):
+    CLAIMS_BY_ID[record.get("id")] = record
+    CLAIMS_BY_VERDICT[record.get("verdict", "").lower()].append(record)
+
+for _record in VERIFIED_CLAIMS:
+    _index_claim(_record)
 
 
 # === Models ===
@@ -120,7 +156,8 @@ async def verify_claim(request: VerifyRequest):
         claim_record["saved_at"] = datetime.utcnow().isoformat() + "Z"
         
         VERIFIED_CLAIMS.append(claim_record)
-        save_claims(VERIFIED_CLAIMS)
+        _index_claim(claim_record)
+        append_claim(claim_record)
 
         logger.success(f"VERDICT: {response.verdict} (confidence: {response.confidence}) | Saved as ID {claim_record['id']}")
 
@@ -141,11 +178,8 @@ async def get_all_claims(
     skip: int = 0,
     verdict: Optional[str] = None
 ):
-    filtered = VERIFIED_CLAIMS.copy()
-
-    if verdict:
-        verdict_lower = verdict.strip().lower()
-        filtered = [c for c in filtered if c.get("verdict", "").lower() == verdict_lower]
+    # The verdict index avoids rescanning (and copying) the full history
+    filtered = CLAIMS_BY_VERDICT[verdict.strip().lower()] if verdict else VERIFIED_CLAIMS
 
     total = len(filtered)
     claims = filtered[skip:skip + limit]
@@ -162,9 +196,9 @@ async def get_all_claims(
 # === Get single claim by ID ===
 @router.get("/claims/{claim_id}")
 async def get_claim_by_id(claim_id: int):
-    for claim in VERIFIED_CLAIMS:
-        if claim.get("id") == claim_id:
-            return claim
+    claim = CLAIMS_BY_ID.get(claim_id)
+    if claim is not None:
+        return claim
     raise HTTPException(status_code=404, detail="Claim not found")
 
 
@@ -1,3 +1,4 @@
+import operator
 from typing import TypedDict, Annotated, List, Optional, Dict, Any
 from dataclasses import dataclass
 from typing_extensions import TypedDict
@@ -20,8 +21,9 @@ class VerificationState(TypedDict):
     should_continue: bool
     next_node: Optional[str]
     
-    # Additional metadata
-    messages: Annotated[List[Dict[str, Any]], "append"]
+    # Additional metadata — operator.add lets nodes return just the new
+    # messages and have LangGraph concatenate them
+    messages: Annotated[List[Dict[str, Any]], operator.add]
     verification_id: Optional[str]
     timestamp: Optional[str]
     
@@ -39,27 +41,23 @@ class AgentState:
     retrieved_documents: List[EvidenceItem] = None
     intermediate_results: Dict[str, Any] = None
 
-def update_messages(state: VerificationState, message: Dict[str, Any]) -> VerificationState:
-    """Helper function to append messages to the state."""
-    return {
-        **state,
-        "messages": state["messages"] + [message]
-    }
+# The helpers return partial updates — LangGraph merges just the changed
+# keys, so nodes no longer shallow-copy the whole state per transition
+
+def update_messages(state: VerificationState, message: Dict[str, Any]) -> Dict[str, Any]:
+    """Helper function to append a message via the state's add reducer."""
+    return {"messages": [message]}
 
-def set_detection_result(state: VerificationState, detection_result: DetectionResult) -> VerificationState:
+def set_detection_result(state: VerificationState, detection_result: DetectionResult) -> Dict[str, Any]:
     """Helper function to set the detection result in state."""
     return {
-        **state,
         "detection_result": detection_result,
         "search_queries": detection_result.search_queries if detection_result else None
     }
 
-def set_verification_result(state: VerificationState, verification_result: VerificationResult) -> VerificationState:
+def set_verification_result(state: VerificationState, verification_result: VerificationResult) -> Dict[str, Any]:
     """Helper function to set the verification result in state."""
-    return {
-        **state,
-        "verification_result": verification_result
-    }
+    return {"verification_result": verification_result}
 
 def should_continue_execution(state: VerificationState) -> bool:
     """Determine whether the workflow should continue to the next node."""
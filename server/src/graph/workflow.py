@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Literal,Optional,List, Dict, Any
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
@@ -12,52 +13,50 @@ from .state import (
     set_verification_result
 )
 
-def detect_claim(state: VerificationState) -> VerificationState:
+# Nodes return only the keys they changed — LangGraph merges partial
+# updates, so there is no full state copy per transition
+
+def detect_claim(state: VerificationState) -> Dict[str, Any]:
     """Node that performs claim detection and structuring."""
     claim = state["claim"]
-    
+
     try:
         detection_result = detector_agent.detect(claim)
-        updated_state = set_detection_result(state, detection_result)
         return {
-            **updated_state,
+            **set_detection_result(state, detection_result),
             "should_continue": True,
             "next_node": "verify"
         }
     except Exception as e:
         return {
-            **state,
             "should_continue": False,
             "verification_result": None,
-            "messages": state["messages"] + [{
+            "messages": [{
                 "role": "system",
                 "content": f"Detection failed with error: {str(e)}"
             }]
         }
 
-def verify_claim(state: VerificationState) -> VerificationState:
+def verify_claim(state: VerificationState) -> Dict[str, Any]:
     """Node that performs comprehensive claim verification."""
     detection_result = state.get("detection_result")
-    
+
     try:
         verification_result = verifier_agent.verify_claim(
             state["claim"],
             detection=detection_result
         )
-        
-        updated_state = set_verification_result(state, verification_result)
-        
+
         return {
-            **updated_state,
+            **set_verification_result(state, verification_result),
             "should_continue": False,  # Verification is complete
             "retrieved_evidence": verification_result.evidence
         }
     except Exception as e:
         return {
-            **state,
             "should_continue": False,
             "verification_result": None,
-            "messages": state["messages"] + [{
+            "messages": [{
                 "role": "system",
                 "content": f"Verification failed with error: {str(e)}"
             }]
@@ -106,6 +105,16 @@ def create_verification_workflow():
     
     return verification_graph
 
+@lru_cache(maxsize=1)
+def get_verification_graph():
+    """Compiled workflow graph, built once per process.
+
+    Compiling the StateGraph on every run re-validates nodes and edges for
+    no benefit — the compiled graph is stateless and safe to reuse across
+    claims.
+    """
+    return create_verification_workflow()
+
 def run_verification_workflow(
     claim: str, 
     user_id: Optional[str] = None,
@@ -128,9 +137,9 @@ def run_verification_workflow(
         "evidence_analysis": None
     }
     
-    # Create and execute the workflow
-    verification_graph = create_verification_workflow()
-    
+    # Execute on the shared compiled workflow
+    verification_graph = get_verification_graph()
+
     try:
         final_state = verification_graph.invoke(initial_state)
         return final_state
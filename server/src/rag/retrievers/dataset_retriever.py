@@ -1,5 +1,6 @@
 # src/rag/retrievers/dataset_retriever.py
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Union, Dict, Any
 from loguru import logger
@@ -9,6 +10,7 @@ from langchain_core.documents import Document
 from langchain_community.embeddings import HuggingFaceEmbeddings
 
 from config import VECTORSTORE_PATH, FAISS_INDEX_PATH, FAISS_PK_PATH, EMBEDDING_MODEL_NAME
+from src.rag.vectorstore.embedding_utils import embed_query, get_langchain_embeddings
 
 
 class DatasetRetriever:
@@ -24,11 +26,16 @@ class DatasetRetriever:
         k: int = 6,
     ):
         self.k = k
-        self.embeddings = HuggingFaceEmbeddings(
-            model_name=embedding_model_name,
-            model_kwargs={"device": "cpu"},
-            encode_kwargs={"normalize_embeddings": True},
-        )
+        # Share the process-wide embeddings instance — loading a second copy
+        # of the model weights would double cold-start time and RAM
+        if embedding_model_name == EMBEDDING_MODEL_NAME:
+            self.embeddings = get_langchain_embeddings()
+        else:
+            self.embeddings = HuggingFaceEmbeddings(
+                model_name=embedding_model_name,
+                model_kwargs={"device": "cpu"},
+                encode_kwargs={"normalize_embeddings": True},
+            )
 
         self.vectorstore = None
         self.use_faiss = use_faiss
@@ -104,8 +111,11 @@ class DatasetRetriever:
                     filter=where_clause if where_clause else None
                 )
             else:  # FAISS
-                # FAISS doesn't support native filtering → post-filter
-                docs = self.vectorstore.similarity_search(query, k=k * 3)
+                # FAISS doesn't support native filtering → post-filter.
+                # Cached query embedding means the real/fake convenience
+                # retrievers only pay for one encoder pass per claim.
+                vec = embed_query(query)
+                docs = self.vectorstore.similarity_search_by_vector(vec, k=k * 3)
                 docs = self._post_filter_docs(docs, where_clause)
 
             logger.debug(f"Retrieved {len(docs)} documents for query: {query[:60]}...")
@@ -116,18 +126,20 @@ class DatasetRetriever:
             return []
 
     def _post_filter_docs(self, docs: List[Document], where_clause: Dict) -> List[Document]:
-        """Manual filtering for FAISS (since it doesn't support metadata filters natively)."""
+        """Manual filtering for FAISS (since it doesn't support metadata filters natively).
+
+        Stops scanning as soon as k survivors are found instead of filtering
+        every candidate and slicing afterwards.
+        """
+        wanted = list(where_clause.items())
         filtered = []
         for doc in docs:
             meta = doc.metadata
-            match = True
-            for key, val in where_clause.items():
-                if meta.get(key) != val:
-                    match = False
-                    break
-            if match:
+            if all(meta.get(key) == val for key, val in wanted):
                 filtered.append(doc)
-        return filtered[:self.k]
+                if len(filtered) == self.k:
+                    break
+        return filtered
 
     def retrieve_real_news(self, query: str, k: int = 5) -> List[Document]:
         """Convenience: Get only verified real news articles."""
@@ -153,7 +165,17 @@ class DatasetRetriever:
         return DatasetRetrieverWrapper()
 
 
-dataset_retriever = DatasetRetriever()
+@lru_cache(maxsize=1)
+def get_dataset_retriever() -> DatasetRetriever:
+    return DatasetRetriever()
+
+
+def __getattr__(name: str):
+    # PEP 562 lazy singleton: the vectorstore only loads when someone first
+    # touches `dataset_retriever`, not when this module is imported
+    if name == "dataset_retriever":
+        return get_dataset_retriever()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Example usage when running directly
@@ -8,25 +8,35 @@ Now creates empty FAISS if nothing exists → no more crashes!
 from __future__ import annotations
 
 import os
+import pickle
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple, Literal, Union
+from typing import List, Optional, Dict, Any, Tuple, Literal, Set, Union
 
+import faiss
 from loguru import logger
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import Chroma, FAISS
 from langchain_core.documents import Document
 
-from src.rag.vectorstore.embedding_utils import get_langchain_embeddings
+from src.rag.vectorstore.embedding_utils import get_langchain_embeddings, embed_texts
 
 # Config
 from config import VECTORSTORE_PATH
 
 
 class VectorStoreManager:
+    # IVF1024 training needs a healthy number of points per cluster; below
+    # this the exact flat index is kept
+    MIN_VECTORS_FOR_IVFPQ = 1024 * 40
+
     def __init__(self, prefer_chroma: bool = True):
         self.prefer_chroma = prefer_chroma
         self.embeddings = get_langchain_embeddings()
         self.vectorstore: Optional[Union[Chroma, FAISS]] = None
         self.active_backend: Literal["chroma", "faiss", "none"] = "none"
+        self._known_urls: Optional[Set[str]] = None
+        self._count_cache: Optional[int] = None
         self._initialize()
 
     def _initialize(self) -> None:
@@ -40,8 +50,8 @@ class VectorStoreManager:
                     persist_directory=VECTORSTORE_PATH,
                     embedding_function=self.embeddings
                 )
-                count = self.vectorstore._collection.count()
-                logger.success(f"Chroma loaded → {count:,} chunks")
+                self._count_cache = self.vectorstore._collection.count()
+                logger.success(f"Chroma loaded → {self._count_cache:,} chunks")
                 self.active_backend = "chroma"
                 return
             except Exception as e:
@@ -58,21 +68,29 @@ class VectorStoreManager:
                     index_name="index",
                     allow_dangerous_deserialization=True,
                 )
-                count = len(self.vectorstore.docstore._dict)
-                logger.success(f"FAISS loaded → {count:,} chunks (production mode)")
+                self._count_cache = len(self.vectorstore.docstore._dict)
+                logger.success(f"FAISS loaded → {self._count_cache:,} chunks (production mode)")
                 self.active_backend = "faiss"
                 return
             except Exception as e:
                 logger.warning(f"FAISS load failed: {e}")
 
         # 3. NOTHING EXISTS → CREATE EMPTY FAISS (this is the key fix!)
+        # Built directly from an empty index — the old placeholder-doc trick
+        # cost an encoder forward pass plus an index delete at startup. The
+        # model already knows its output width, so no embed call needed.
+        # IndexFlatL2 matches what FAISS.from_documents builds (and what every
+        # existing on-disk index uses), keeping the distance-score convention.
         logger.info("No vectorstore found → creating new empty FAISS index")
-        dummy_doc = Document(page_content="placeholder", metadata={"source": "init"})
-        self.vectorstore = FAISS.from_documents([dummy_doc], self.embeddings)
-        # Remove dummy
-        dummy_id = list(self.vectorstore.docstore._dict.keys())[0]
-        self.vectorstore.delete([dummy_id])
+        dim = self.embeddings.client.get_sentence_embedding_dimension()
+        self.vectorstore = FAISS(
+            embedding_function=self.embeddings,
+            index=faiss.IndexFlatL2(dim),
+            docstore=InMemoryDocstore({}),
+            index_to_docstore_id={},
+        )
         self.active_backend = "faiss"
+        self._count_cache = 0
         logger.success("Empty FAISS vectorstore created — ready for first ingestion")
 
     # === All your methods below stay the same ===
@@ -90,39 +108,122 @@ class VectorStoreManager:
         if not self.vectorstore:
             logger.error("No vectorstore to add to!")
             return []
-        ids = self.vectorstore.add_documents(documents)
+        if isinstance(self.vectorstore, FAISS):
+            # Pre-embed the whole batch in one encoder call and hand FAISS
+            # the finished vectors — skips the wrapper's per-add encode path
+            texts = [doc.page_content for doc in documents]
+            vectors = embed_texts(texts, batch_size=64)
+            ids = self.vectorstore.add_embeddings(
+                text_embeddings=list(zip(texts, vectors)),
+                metadatas=[doc.metadata for doc in documents],
+            )
+        else:
+            ids = self.vectorstore.add_documents(documents)
+        if self._known_urls is not None:
+            self._known_urls.update(
+                url for doc in documents if (url := doc.metadata.get("url"))
+            )
+        # Bump the cached count rather than re-asking the backend (a SQLite
+        # round trip on Chroma)
+        if self._count_cache is not None:
+            self._count_cache += len(documents)
         logger.info(f"Added {len(documents)} documents → total: {self.count():,}")
         return ids
 
+    def known_urls(self) -> Set[str]:
+        """URLs already in the store — a compact set kept in sync by add_documents.
+
+        Rehydrated lazily: from the pickled sidecar if present, otherwise by
+        scanning the docstore exactly once.
+        """
+        if self._known_urls is None:
+            sidecar = self._known_urls_sidecar()
+            try:
+                with open(sidecar, "rb") as f:
+                    self._known_urls = pickle.load(f)
+            except (FileNotFoundError, pickle.PickleError, EOFError):
+                docstore_dict = self.vectorstore.docstore._dict if self.vectorstore else {}
+                self._known_urls = {
+                    doc.metadata["url"]
+                    for doc in docstore_dict.values()
+                    if doc.metadata.get("url")
+                }
+        return self._known_urls
+
+    @staticmethod
+    def _known_urls_sidecar(path: str = "vectorstore/faiss") -> Path:
+        return Path(path) / "known_urls.pkl"
+
+    def _maybe_compress_index(self) -> None:
+        """Swap the exact flat index for IVF+PQ once the corpus is big enough.
+
+        A flat index scans every vector per query; IVF1024,PQ16 probes a
+        bounded cluster set and compresses vectors ~16x.
+        """
+        index = self.vectorstore.index
+        n = index.ntotal
+        if n < self.MIN_VECTORS_FOR_IVFPQ or isinstance(index, faiss.IndexIVFPQ):
+            return
+        logger.info(f"Compressing flat index → IVF1024,PQ16 ({n:,} vectors)")
+        xb = index.reconstruct_n(0, n)
+        # Same metric as the source index — switching it would flip the score
+        # convention (distance vs similarity) under every downstream threshold
+        compressed = faiss.index_factory(index.d, "IVF1024,PQ16", index.metric_type)
+        compressed.train(xb)
+        compressed.add(xb)
+        compressed.nprobe = 16
+        self.vectorstore.index = compressed
+        logger.success("Index compressed — bounded-probe search enabled")
+
     def save_to_faiss(self, path: str = "vectorstore/faiss") -> None:
         if not self.vectorstore:
             logger.error("No data to export")
             return
         logger.info("Exporting current vectorstore → FAISS")
+        if isinstance(self.vectorstore, FAISS):
+            self._maybe_compress_index()
         os.makedirs(path, exist_ok=True)
         self.vectorstore.save_local(folder_path=path, index_name="index")
+        if self._known_urls is not None:
+            with open(self._known_urls_sidecar(path), "wb") as f:
+                pickle.dump(self._known_urls, f)
         logger.success(f"FAISS exported → {path}")
 
     def count(self) -> int:
+        if self._count_cache is not None:
+            return self._count_cache
         if not self.vectorstore:
             return 0
         if isinstance(self.vectorstore, Chroma):
-            return self.vectorstore._collection.count()
-        return len(self.vectorstore.docstore._dict)
+            self._count_cache = self.vectorstore._collection.count()
+        else:
+            self._count_cache = len(self.vectorstore.docstore._dict)
+        return self._count_cache
 
     def status(self) -> Dict[str, Any]:
         return {
             "active_backend": self.active_backend,
             "document_count": self.count(),
             "embedding_model": self.embeddings.model_name,
+            "nprobe": getattr(getattr(self.vectorstore, "index", None), "nprobe", None),
         }
 
 
-# Singleton instance
-vectorstore_manager = VectorStoreManager(prefer_chroma=False)
+# Singleton instance, built lazily (PEP 562) so importing this module
+# doesn't pay the vectorstore load until someone actually uses it
+@lru_cache(maxsize=1)
+def get_vectorstore_manager() -> VectorStoreManager:
+    return VectorStoreManager(prefer_chroma=False)
+
+
+def __getattr__(name: str):
+    if name == "vectorstore_manager":
+        return get_vectorstore_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == "__main__":
+    vectorstore_manager = get_vectorstore_manager()
     print("VectorStore Status:")
     print(f"   Backend: {vectorstore_manager.active_backend.upper()}")
     print(f"   Documents: {vectorstore_manager.count():,}")
\ No newline at end of file
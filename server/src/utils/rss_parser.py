@@ -9,9 +9,16 @@ from __future__ import annotations
 
 import re
 import html
+import pickle
+import time
 import yaml
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from io import BytesIO
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
@@ -20,83 +27,236 @@ from langchain_core.documents import Document
 
 # For forgiving XML parsing and timezone handling
 from lxml import etree
+from lxml.html import fromstring as _html_fromstring
 from dateutil import parser as date_parser
 from dateutil.tz import tzutc
 
+# Compiled once — these run per item per feed
+_WS_RE = re.compile(r"\s+")
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Precompiled XPaths: one C-level descent per field instead of an OR-chain
+# of Python-level find() calls against both RSS and Atom tag names
+_ATOM_NS = {"a": "http://www.w3.org/2005/Atom"}
+_X_TITLE = etree.XPath("title|a:title", namespaces=_ATOM_NS)
+_X_LINK = etree.XPath("link|a:link", namespaces=_ATOM_NS)
+_X_DESC = etree.XPath("description|summary|a:content|a:summary", namespaces=_ATOM_NS)
+_X_DATE = etree.XPath("pubDate|published|a:published", namespaces=_ATOM_NS)
+
 # Load RSS config
 CONFIG_PATH = Path(__file__).parent.parent.parent / "data" / "rss_sources.yaml"
 with open(CONFIG_PATH, "r", encoding="utf-8") as f:
     RSS_CONFIG = yaml.safe_load(f)["rss_sources"]
 
 
+# Bounded fan-out: slow feeds overlap instead of queueing behind each other
+MAX_CONCURRENT_FETCHES = 20
+
+# Feeds update on the order of minutes — verify_claim calls fetch_recent per
+# request, so a short TTL turns the slowest non-LLM stage into a dict lookup
+FETCH_CACHE_TTL_SECONDS = 120
+
+# Conditional-GET cache survives restarts so the first refresh mostly 304s
+HTTP_CACHE_PATH = Path(__file__).parent.parent.parent / "data" / ".rss_cache.pkl"
+
+
 class RSSParser:
     def __init__(self):
         self.headers = {"User-Agent": "TruthPulse/2.0 (Windows)"}
+        # One session for all feeds: keep-alive reuses TCP/TLS connections
+        # across feeds on the same host instead of handshaking per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(self.headers)
+        self._fetch_cache: Dict[tuple, tuple] = {}  # (days, max_per_feed) → (timestamp, docs)
+        # url → (etag, last_modified) and url → parsed docs; a 304 response
+        # means zero bytes over the wire and zero parsing
+        self._etags: Dict[str, tuple] = {}
+        self._feed_doc_cache: Dict[str, List[Document]] = {}
+        self._load_http_cache()
+
+    def _load_http_cache(self) -> None:
+        try:
+            with open(HTTP_CACHE_PATH, "rb") as f:
+                cached = pickle.load(f)
+            self._etags = cached.get("etags", {})
+            self._feed_doc_cache = cached.get("docs", {})
+        except (FileNotFoundError, pickle.PickleError, EOFError):
+            pass
+
+    def _save_http_cache(self) -> None:
+        try:
+            HTTP_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(HTTP_CACHE_PATH, "wb") as f:
+                pickle.dump({"etags": self._etags, "docs": self._feed_doc_cache}, f)
+        except Exception as e:
+            logger.debug(f"Could not persist RSS HTTP cache: {e}")
 
     def fetch_recent(self, days: int = 7, max_per_feed: int = 15) -> List[Document]:
+        cache_key = (days, max_per_feed)
+        cached = self._fetch_cache.get(cache_key)
+        if cached and time.time() - cached[0] < FETCH_CACHE_TTL_SECONDS:
+            logger.debug(f"RSS cache hit for days={days}, max_per_feed={max_per_feed}")
+            return cached[1]
+
         cutoff = datetime.now() - timedelta(days=days)
         docs: List[Document] = []
 
-        for category, feeds in RSS_CONFIG.items():
-            for feed in feeds:
+        feed_jobs = [
+            (category, feed)
+            for category, feeds in RSS_CONFIG.items()
+            for feed in feeds
+        ]
+        if not feed_jobs:
+            return docs
+
+        # Network-bound: fetch feeds concurrently so wall time ≈ slowest feed,
+        # not the sum of all timeouts
+        workers = min(MAX_CONCURRENT_FETCHES, len(feed_jobs))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {
+                pool.submit(self._fetch_feed, feed, cutoff, category, max_per_feed): feed
+                for category, feed in feed_jobs
+            }
+            for future in as_completed(futures):
+                feed = futures[future]
                 try:
-                    r = requests.get(feed["url"], headers=self.headers, timeout=12)
-                    r.raise_for_status()
-                    r.encoding = 'utf-8'
-                    new_docs = self._parse_xml(r.text, feed, cutoff, category, max_per_feed)
+                    new_docs = future.result()
                     docs.extend(new_docs)
                     logger.debug(f"{feed['name']:30} → {len(new_docs)} articles")
                 except Exception as e:
                     logger.warning(f"Failed {feed['name']}: {e}")
 
         logger.success(f"Fetched {len(docs)} recent articles from RSS")
+        self._fetch_cache[cache_key] = (time.time(), docs)
+        self._save_http_cache()
         return docs
 
-    def _parse_xml(self, xml_text: str, feed: Dict, cutoff: datetime, category: str, max_per_feed: int) -> List[Document]:
+    def _fetch_feed(self, feed: Dict, cutoff: datetime, category: str, max_per_feed: int) -> List[Document]:
+        url = feed["url"]
+        headers = {}
+        etag, last_modified = self._etags.get(url, (None, None))
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        r = self.session.get(url, headers=headers, timeout=12)
+        if r.status_code == 304 and url in self._feed_doc_cache:
+            # Feed unchanged — reuse the full parsed item list; the caller's
+            # window and cap are applied below like on a fresh fetch
+            docs = self._feed_doc_cache[url]
+        else:
+            r.raise_for_status()
+            # Raw bytes straight to lxml — decoding to str and re-encoding would
+            # copy the full feed buffer twice; lxml honours the XML declaration
+            docs = self._parse_xml(r.content, feed, category)
+            self._etags[url] = (r.headers.get("ETag"), r.headers.get("Last-Modified"))
+            self._feed_doc_cache[url] = docs
+        return self._apply_window(docs, cutoff, max_per_feed)
+
+    @staticmethod
+    def _apply_window(docs: List[Document], cutoff: datetime, max_per_feed: int) -> List[Document]:
+        """Per-call cutoff/cap over the full cached item list.
+
+        The cache stores every parsed item so callers with wider windows
+        (e.g. the verifier's 120-day fetch) aren't starved by a cache entry
+        written under a narrower one.
+        """
+        selected = []
+        for doc in docs:
+            try:
+                pub_dt = datetime.fromisoformat(doc.metadata["published"]).replace(tzinfo=None)
+                if pub_dt < cutoff:
+                    continue
+            except (KeyError, ValueError):
+                pass  # unparseable dates stay in, matching the parse fallback
+            selected.append(doc)
+            if len(selected) == max_per_feed:
+                break
+        return selected
+
+    def _parse_xml(self, xml_bytes: bytes, feed: Dict, category: str) -> List[Document]:
+        """Parse every item in the feed; windowing happens per call.
+
+        Streaming parse: items are processed as their end tags arrive and
+        freed immediately, so memory stays O(1 item) rather than holding the
+        whole feed DOM. All items are kept so the conditional-GET cache can
+        serve callers with any cutoff/cap.
+        """
         try:
-            # lxml with recovery (forgiving for malformed XML)
-            parser = etree.XMLParser(recover=True, encoding='utf-8')
-            root = etree.fromstring(xml_text.encode('utf-8'), parser=parser)
-            
-            # Find items (RSS or Atom)
-            items = root.findall(".//item") or root.findall(".//entry")
+            context = etree.iterparse(
+                BytesIO(xml_bytes),
+                events=("end",),
+                recover=True,
+            )
             docs = []
-            for item in items[:max_per_feed]:
-                title = self._clean_text(self._get_text(item.find("title")) or self._get_text(item.find("{http://www.w3.org/2005/Atom}title")))
-                link = self._get_text(item.find("link")) or self._get_attr(item.find("{http://www.w3.org/2005/Atom}link"), "href")
-                desc_elem = item.find("description") or item.find("summary") or item.find("{http://www.w3.org/2005/Atom}content") or item.find("{http://www.w3.org/2005/Atom}summary")
-                desc = self._clean_html(self._get_text(desc_elem)) if desc_elem is not None else ""
-
-                content = f"{title} {desc}".strip()
-                if len(content) < 60:
+            for _, elem in context:
+                tag = elem.tag
+                if not isinstance(tag, str) or not (tag.endswith("item") or tag.endswith("entry")):
                     continue
 
-                # Safe date parsing with dateutil (fixes timezone mismatches)
-                pubdate = self._get_text(item.find("pubDate")) or self._get_text(item.find("published")) or self._get_text(item.find("{http://www.w3.org/2005/Atom}published"))
-                try:
-                    pub_dt = date_parser.parse(pubdate, tzinfos={"UTC": tzutc()}) if pubdate else datetime.now()
-                    if pub_dt < cutoff:
-                        continue
-                except:
-                    pub_dt = datetime.now()  # Fallback
-
-                doc = Document(
-                    page_content=content,
-                    metadata={
-                        "title": title[:500],
-                        "source_name": feed["name"],
-                        "source_category": category.replace("_", " ").title(),
-                        "url": link,
-                        "published": pub_dt.isoformat(),
-                        "reliable": feed.get("reliable", False),
-                    }
-                )
-                docs.append(doc)
+                doc = self._parse_item(elem, feed, category)
+                if doc is not None:
+                    docs.append(doc)
+
+                # Free the processed subtree and everything before it
+                elem.clear()
+                parent = elem.getparent()
+                if parent is not None:
+                    while elem.getprevious() is not None:
+                        del parent[0]
             return docs
         except Exception as e:
             logger.warning(f"XML parse failed for {feed['name']}: {e}")
             return []
 
+    def _parse_item(self, item, feed: Dict, category: str) -> Optional[Document]:
+        title_elems = _X_TITLE(item)
+        title = self._clean_text(title_elems[0].text or "" if title_elems else "")
+        link_elems = _X_LINK(item)
+        link = (link_elems[0].text or link_elems[0].get("href") or "") if link_elems else ""
+        desc_elems = _X_DESC(item)
+        desc = self._clean_html(desc_elems[0].text or "") if desc_elems else ""
+
+        # Length gate runs before any date parsing so short items bail out
+        # without paying for it
+        content = f"{title} {desc}".strip() if desc else title
+        if len(content) < 60:
+            return None
+
+        date_elems = _X_DATE(item)
+        pubdate = date_elems[0].text if date_elems else ""
+        pub_dt = datetime.now()  # Fallback for missing/unparseable dates
+        if pubdate:
+            # RFC822 covers nearly all RSS pubDates and parses natively;
+            # dateutil stays as the forgiving fallback for odd formats
+            try:
+                pub_dt = parsedate_to_datetime(pubdate)
+            except (TypeError, ValueError):
+                try:
+                    pub_dt = date_parser.parse(pubdate, tzinfos={"UTC": tzutc()})
+                except Exception:
+                    pass
+
+        return Document(
+            page_content=content,
+            metadata={
+                "title": title[:500],
+                "source_name": feed["name"],
+                "source_category": category.replace("_", " ").title(),
+                "url": link,
+                "published": pub_dt.isoformat(),
+                "reliable": feed.get("reliable", False),
+            }
+        )
+
     @staticmethod
     def _get_text(elem):
         return elem.text if elem is not None else ""
@@ -110,18 +270,19 @@ class RSSParser:
         if not text:
             return ""
         text = html.unescape(text)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+        return _WS_RE.sub(" ", text).strip()
 
     @staticmethod
     def _clean_html(html_text: str) -> str:
         if not html_text:
             return ""
-        # Strip HTML tags
-        clean = re.sub(r'<[^>]+>', ' ', html_text)
-        clean = html.unescape(clean)
-        clean = re.sub(r'\s+', ' ', clean).strip()
-        return clean
+        # lxml strips tags and resolves entities in one C-level pass;
+        # the regex pipeline stays as fallback for unparseable fragments
+        try:
+            clean = _html_fromstring(html_text).text_content()
+        except Exception:
+            clean = html.unescape(_TAG_RE.sub(" ", html_text))
+        return _WS_RE.sub(" ", clean).strip()
 
 
 # Global instance